@@ -12,15 +12,23 @@ used interactively or from CI.
 """
 
 import argparse
-import glob
 import os
 import shutil
+import stat
 import subprocess
 import sys
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Set
 
-from source.util.res_i18n_extractor import extract_i18n
-from source.util.res_i18n_injector import inject_i18n
+from source.util._tools import SUBPROC_FLAGS
+
+# Force UTF-8 output for Windows consoles to avoid UnicodeEncodeError with Chinese
+# characters; done once at import so every print (including imported modules) uses it
+if sys.platform == "win32":
+    for _stream in (sys.stdout, sys.stderr):
+        if _stream is not None and hasattr(_stream, "reconfigure"):
+            _stream.reconfigure(encoding="utf-8", errors="replace")
 
 # Use only relative paths (relative to current working directory)
 TOOLS = os.path.join("_tools_")
@@ -30,26 +38,103 @@ extracted_txt_folder = os.path.join(WORKSPACE, "extracted-txt")
 # txt2fnt writes font output files under workspace/modded-assets/ui/fonts per README
 MODDED_ASSETS = os.path.join(WORKSPACE, "modded-assets", "ui", "fonts")
 
-
-def check_file(path: str) -> bool:
-    if not os.path.exists(path):
-        print(f"缺少檔案: {path}")
+# tool and output paths, joined once
+QUICKBMS_EXE = os.path.join(TOOLS, "quickbms", "quickbms.exe")
+FONTGEN_EXE = os.path.join(TOOLS, "fontgen", "fontgen.exe")
+TXT2FNT_EXE = os.path.join(TOOLS, "txt2fnt", "txt2fnt.exe")
+TTF_DIR = os.path.join(TOOLS, "ttf")
+OUT_NAME = "noto_sans_cjk_regular"
+OUT_FNT = os.path.join(MODDED_ASSETS, f"{OUT_NAME}.fnt")
+OUT_PNG = os.path.join(MODDED_ASSETS, f"{OUT_NAME}.png")
+
+# stat results for everything under _tools_, keyed by the same relative paths
+# the checks below build with os.path.join; filled by _prime_tools_cache()
+_stat_cache: Dict[str, os.stat_result] = {}
+
+
+# directories already created by _ensure_dir() during this process
+_mkdir_done: Set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """os.makedirs(path, exist_ok=True), but only once per process."""
+    if path in _mkdir_done:
+        return
+    os.makedirs(path, exist_ok=True)
+    _mkdir_done.add(path)
+
+
+def _prime_tools_cache() -> None:
+    """Stat every entry under `_tools_` in a single scandir walk."""
+    _stat_cache.clear()
+    stack = [TOOLS]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    # follow links so a symlinked tool still counts as a file
+                    _stat_cache[entry.path] = entry.stat()
+                except OSError:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+
+def check_file(path: str, quiet: bool = False) -> bool:
+    """Return True if `path` is a regular file (directories don't count).
+
+    A missing file is reported unless `quiet` is set.
+    """
+    if not _stat_cache:
+        _prime_tools_cache()
+    st = _stat_cache.get(path)
+    if st is None:
+        # not under _tools_: stat it directly
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        if not quiet:
+            print(f"缺少檔案: {path}")
         return False
     return True
 
 
 def find_ttfs(folder: str) -> List[str]:
-    if not os.path.exists(folder):
+    if not _stat_cache:
+        _prime_tools_cache()
+    if folder in _stat_cache:
+        return sorted(
+            p
+            for p in _stat_cache
+            if os.path.dirname(p) == folder
+            and p.lower().endswith(".ttf")
+            and stat.S_ISREG(_stat_cache[p].st_mode)
+        )
+    # folder outside of _tools_ (or missing): fall back to a directory listing
+    try:
+        with os.scandir(folder) as it:
+            names = [
+                e.name
+                for e in it
+                if e.is_file(follow_symlinks=False) and e.name.lower().endswith(".ttf")
+            ]
+    except FileNotFoundError:
         return []
-    return sorted(glob.glob(os.path.join(folder, "*.ttf")))
+    names.sort()
+    return [os.path.join(folder, n) for n in names]
 
 
 def run_txt2fnt(ttf: str, fs: int = 48) -> int:
-    os.makedirs(MODDED_ASSETS, exist_ok=True)
-    txt2fnt_exe = os.path.join(TOOLS, "txt2fnt", "txt2fnt.exe")
+    _ensure_dir(MODDED_ASSETS)
 
     cmd = [
-        str(txt2fnt_exe),
+        TXT2FNT_EXE,
         "-tf",
         extracted_txt_folder,
         "-fs",
@@ -57,71 +142,139 @@ def run_txt2fnt(ttf: str, fs: int = 48) -> int:
         "-ttf",
         ttf,
         "-o",
-        "noto_sans_cjk_regular",
+        OUT_NAME,
         "-ff",
         str(MODDED_ASSETS),
         # "--treat-xml-as-text"
     ]
     print("執行指令:", " ".join(cmd))
     # txt2fnt expects to be run from the folder containing the ttf (it loads by name)
-    proc = subprocess.run(cmd, capture_output=True, text=True)
-    print(proc.stdout)
-    print(proc.stderr)
-    return proc.returncode
+    # stream output as it is produced instead of buffering it until exit
+    with subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        errors="replace",
+        creationflags=SUBPROC_FLAGS,
+    ) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+        return proc.wait()
 
 
 def verify_txt2fnt_outputs() -> bool:
     """Verify that txt2fnt produced the expected .fnt and .png files."""
-    fnt = os.path.join(MODDED_ASSETS, "noto_sans_cjk_regular.fnt")
-    png = os.path.join(MODDED_ASSETS, "noto_sans_cjk_regular.png")
     ok = True
-    if not os.path.exists(fnt):
-        print(f"缺少預期輸出檔案: {fnt}")
+    if not os.path.exists(OUT_FNT):
+        print(f"缺少預期輸出檔案: {OUT_FNT}")
         ok = False
-    if not os.path.exists(png):
-        print(f"缺少預期輸出檔案: {png}")
+    if not os.path.exists(OUT_PNG):
+        print(f"缺少預期輸出檔案: {OUT_PNG}")
         ok = False
     return ok
 
 
+def _is_same_copy(src: str, dst: str) -> bool:
+    """Return True if `dst` already holds the copy2() result of `src`.
+
+    copy2 preserves mtime, so matching size and a dst mtime no older than
+    src is enough to tell that an earlier run already copied this file.
+    """
+    try:
+        src_st = os.stat(src)
+        dst_st = os.stat(dst)
+    except OSError:
+        return False
+    return (
+        dst_st.st_size == src_st.st_size
+        and dst_st.st_mtime_ns >= src_st.st_mtime_ns
+    )
+
+
 def copy_extracted_to_flat(extracted_res: str, dest: str, language: str) -> None:
-    os.makedirs(dest, exist_ok=True)
+    _ensure_dir(dest)
     # expected files according to README
     candidates = [
         os.path.join(extracted_res, "lang", f"texts_{language}.xml"),
         os.path.join(extracted_res, "lang", f"export_{language}.xml"),
     ]
-    for p in candidates:
-        if os.path.exists(p):
-            shutil.copy2(p, os.path.join(dest, os.path.basename(p)))
-            print(f"已複製 {p} -> {os.path.join(dest, os.path.basename(p))}")
-        else:
-            print(f"警告: 未找到預期的提取檔案: {p}")
+
+    def _copy_one(p: str) -> str:
+        # runs on a worker thread; the message is printed in candidate order
+        if not os.path.exists(p):
+            return f"警告: 未找到預期的提取檔案: {p}"
+        dst = os.path.join(dest, os.path.basename(p))
+        if _is_same_copy(p, dst):
+            return f"已是最新，略過複製: {dst}"
+        shutil.copy2(p, dst)
+        return f"已複製 {p} -> {dst}"
+
+    # the copies are independent, so overlap their I/O
+    with ThreadPoolExecutor(max_workers=len(candidates)) as ex:
+        for msg in ex.map(_copy_one, candidates):
+            print(msg)
+
+
+@dataclass
+class Prereqs:
+    """Result of a single check_prereqs() pass."""
+
+    quickbms: bool = False
+    fontgen: bool = False
+    txt2fnt: bool = False
+    ttfs: List[str] = field(default_factory=list)
+
+    @property
+    def font_tools_ok(self) -> bool:
+        return self.fontgen and self.txt2fnt and bool(self.ttfs)
+
+    def report_quickbms(self) -> None:
+        """Print what check_prereqs() found missing for the QuickBMS steps."""
+        if not self.quickbms:
+            print(f"缺少檔案: {QUICKBMS_EXE}")
+
+    def report_font_tools(self) -> None:
+        """Print what check_prereqs() found missing for the font steps."""
+        if not self.txt2fnt:
+            print(f"缺少檔案: {TXT2FNT_EXE}")
+        if not self.fontgen:
+            print(f"缺少檔案: {FONTGEN_EXE}")
+        if not self.ttfs:
+            print(f"在 {TTF_DIR} 中未找到 TTF 檔案")
 
 
 def check_prereqs(
-    require_quickbms: bool = True, require_font_tools: bool = True
-) -> bool:
-    ok = True
+    require_quickbms: bool = True,
+    require_font_tools: bool = True,
+    fast_fail: bool = False,
+) -> Prereqs:
+    """Probe the required tools, single files first and the TTF listing last.
+
+    Probing is silent; callers print diagnostics through the returned
+    Prereqs' report_*() methods at the step that needs the tool. With
+    `fast_fail` the remaining probes are skipped after the first miss
+    (their fields stay False/empty).
+    """
+    prereqs = Prereqs()
     if require_quickbms:
-        ok = check_file(os.path.join(TOOLS, "quickbms", "quickbms.exe")) and ok
+        prereqs.quickbms = check_file(QUICKBMS_EXE, quiet=True)
+        if fast_fail and not prereqs.quickbms:
+            return prereqs
     if require_font_tools:
-        ok = check_file(os.path.join(TOOLS, "fontgen", "fontgen.exe")) and ok
-        ok = check_file(os.path.join(TOOLS, "txt2fnt", "txt2fnt.exe")) and ok
-        ttfs = find_ttfs(os.path.join(TOOLS, "ttf"))
-        if not ttfs:
-            print(f"在 {os.path.join(TOOLS, 'ttf')} 中未找到 TTF 檔案")
-            ok = False
-    return ok
+        prereqs.txt2fnt = check_file(TXT2FNT_EXE, quiet=True)
+        if fast_fail and not prereqs.txt2fnt:
+            return prereqs
+        prereqs.fontgen = check_file(FONTGEN_EXE, quiet=True)
+        if fast_fail and not prereqs.fontgen:
+            return prereqs
+        prereqs.ttfs = find_ttfs(TTF_DIR)
+    return prereqs
 
 
 def main(argv: List[str]) -> int:
-    # Force UTF-8 output for Windows consoles to avoid UnicodeEncodeError with Chinese characters
-    if sys.stdout and sys.stdout.encoding != 'utf-8':
-        sys.stdout.reconfigure(encoding='utf-8')
-    if sys.stderr and sys.stderr.encoding != 'utf-8':
-        sys.stderr.reconfigure(encoding='utf-8')
-
     parser = argparse.ArgumentParser(description="Wartales repack font helper")
     parser.add_argument(
         "-lang",
@@ -164,10 +317,18 @@ def main(argv: List[str]) -> int:
 
     args = parser.parse_args(argv)
 
+    # stat _tools_ once and probe every tool up front (silently); each step
+    # below branches on the cached result and reports only what it needs
+    _prime_tools_cache()
+    prereqs = check_prereqs(require_quickbms=True, require_font_tools=True)
+
     # Handle injection mode
     if args.inject_xml_dir:
+        from source.util.res_i18n_injector import inject_i18n
+
         print(f"正在將 XML 從 {args.inject_xml_dir} 注入到 {args.res_pak}...")
-        if not check_prereqs(require_quickbms=True, require_font_tools=False):
+        if not prereqs.quickbms:
+            prereqs.report_quickbms()
             print("缺少 QuickBMS 工具")
             return 2
 
@@ -180,7 +341,8 @@ def main(argv: List[str]) -> int:
             return 1
 
     # Step 1: check quickbms
-    if not check_prereqs(require_quickbms=True, require_font_tools=False):
+    if not prereqs.quickbms:
+        prereqs.report_quickbms()
         print("缺少 QuickBMS 工具：請放置 _tools_/quickbms/quickbms.exe")
         return 2
 
@@ -189,6 +351,8 @@ def main(argv: List[str]) -> int:
         print(f"未找到 res.pak: {res_pak}")
         return 3
 
+    from source.util.res_i18n_extractor import extract_i18n
+
     print("正在提取本地化檔案...")
     ok = extract_i18n(
         language=args.language, res_pak=str(res_pak), list_only=False, verbose=True
@@ -206,14 +370,14 @@ def main(argv: List[str]) -> int:
         return 0
 
     # Step 4: check font tools and available TTFs
-    if not check_prereqs(require_quickbms=False, require_font_tools=True):
+    if not prereqs.font_tools_ok:
+        prereqs.report_font_tools()
         print(
             "缺少字體工具。請確保 _tools_/fontgen, _tools_/txt2fnt 和 _tools_/ttf 存在"
         )
         return 5
 
-    ttfs = find_ttfs(os.path.join(TOOLS, "ttf"))
-    if not ttfs:
+    if not prereqs.ttfs:
         print("沒有可處理的 TTF 檔案")
         return 6
 
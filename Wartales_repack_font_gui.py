@@ -10,29 +10,85 @@ Notes:
 - The TTF chooser reads from `_tools_/ttf/*.ttf`.
 """
 
+import argparse
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import tkinter.font as tkfont
 import threading
+import queue
+import functools
 import os
-import glob
 import subprocess
-from typing import List
+import time
+from typing import Optional, Tuple
+
+from source.util._tools import SUBPROC_FLAGS
 
 
 TOOLS_TTF = os.path.join("_tools_", "ttf")
 
+EXE_NAME = "Wartales_repack_font.exe"
+
+# named Tk fonts enlarged at startup for readability
+SCALED_FONT_NAMES = ("TkDefaultFont", "TkTextFont", "TkMenuFont", "TkHeadingFont")
+
+# lines kept in the output log widget
+LOG_MAX_LINES = 5000
+
+# extra CLI arguments appended for each run mode
+_MODE_ARGS = {
+    "extract": ("--extract-only",),
+    "inject": ("--inject-xml", "_new_xml_"),
+    "inject_and_repack": ("--inject-xml", "_new_xml_", "--continue-after-inject"),
+}
 
-def find_ttfs() -> List[str]:
-    """Return a list of TTF basenames found in `_tools_/ttf`."""
-    pattern = os.path.join(TOOLS_TTF, "*.ttf")
-    return [os.path.basename(p) for p in sorted(glob.glob(pattern))]
+# (st_mtime_ns of TOOLS_TTF, sorted basenames) from the last scan
+_ttf_cache: Optional[Tuple[int, Tuple[str, ...]]] = None
+
+
+def find_ttfs() -> Tuple[str, ...]:
+    """Return the TTF basenames found in `_tools_/ttf`, sorted case-insensitively.
+
+    Matches `.ttf` in any case. The listing is cached and only rebuilt when the
+    folder's mtime changes.
+    """
+    global _ttf_cache
+    try:
+        mt = os.stat(TOOLS_TTF).st_mtime_ns
+    except OSError:
+        _ttf_cache = None
+        return ()
+    if _ttf_cache and _ttf_cache[0] == mt:
+        return _ttf_cache[1]
+    with os.scandir(TOOLS_TTF) as it:
+        # DirEntry.is_file uses the type info from the directory read; no extra stat
+        names = [
+            e.name
+            for e in it
+            if e.name.lower().endswith(".ttf") and e.is_file(follow_symlinks=False)
+        ]
+    names.sort(key=str.lower)
+    ttfs = tuple(names)
+    _ttf_cache = (mt, ttfs)
+    return ttfs
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_exe() -> str:
+    """Locate Wartales_repack_font.exe next to this script or in the cwd.
+
+    Raises FileNotFoundError when missing; failures are not cached, so a
+    freshly built exe is picked up on the next run.
+    """
+    for folder in (os.path.dirname(__file__), os.getcwd()):
+        exe_path = os.path.join(folder, EXE_NAME)
+        if os.path.exists(exe_path):
+            return exe_path
+    raise FileNotFoundError(EXE_NAME)
 
 
 # debug arg: --debug
 def parse_args():
-    import argparse
-
     parser = argparse.ArgumentParser(description="Wartales Repack Font GUI")
     parser.add_argument(
         "--debug",
@@ -42,9 +98,9 @@ def parse_args():
     )
     return parser.parse_args()
 
-args = parse_args()
-global IS_DEBUG
-IS_DEBUG = args.debug
+
+# set from the --debug flag when run as a script
+IS_DEBUG = False
 
 
 class ToolTip:
@@ -119,13 +175,13 @@ class RepackApp:
         # Slightly increase base UI fonts for better readability
         # (this adjusts default named Tcl/Tk fonts used by ttk and Text widgets)
         font_increase = 2
-        for name in ("TkDefaultFont", "TkTextFont", "TkMenuFont", "TkHeadingFont"):
-            try:
-                f = tkfont.nametofont(name)
-                f.configure(size=max(6, f.cget("size") + font_increase))
-            except Exception:
-                # Some platforms may not have every named font available
-                pass
+        # Some platforms may not have every named font available
+        present = set(tkfont.names(root))
+        fonts = tuple(
+            tkfont.nametofont(name) for name in SCALED_FONT_NAMES if name in present
+        )
+        for f in fonts:
+            f.configure(size=max(6, f.cget("size") + font_increase))
 
         frm = ttk.Frame(root, padding=12)
         frm.pack(fill=tk.BOTH, expand=True)
@@ -153,6 +209,8 @@ class RepackApp:
         self.ttf_menu = ttk.Combobox(
             frm, textvariable=self.ttf_var, state="readonly", width=40
         )
+        # Values last written to the combobox; None forces the first fill
+        self._ttf_cache_tuple = None
         self._refresh_ttf_list()
         self.ttf_menu.grid(column=1, row=row, sticky=tk.W)
         ttk.Button(frm, text="重新整理", command=self._refresh_ttf_list).grid(
@@ -187,7 +245,8 @@ class RepackApp:
         HelpLabel(run_frame, "執行字體重打包流程：\n1. 從 res.pak 提取中文文本\n2. 根據文本與選定 TTF 生成字體\n3. 將生成的字體打包進 assets.pak").pack(side=tk.LEFT, padx=2)
 
         # Col 1: Status
-        self.status_lbl = tk.Label(frm, text="就緒")
+        self.status_var = tk.StringVar(value="就緒")
+        self.status_lbl = tk.Label(frm, textvariable=self.status_var)
         self.status_lbl.grid(column=1, row=row, sticky=tk.W)
 
         # Col 2: Extract button + Help
@@ -204,6 +263,12 @@ class RepackApp:
         self.inject_btn.pack(side=tk.LEFT)
         HelpLabel(inject_frame, "將 _new_xml_ 資料夾中的翻譯檔注入 res.pak\n(Inject translation files from _new_xml_ folder into res.pak)").pack(side=tk.LEFT, padx=2)
 
+        # Progress bar (shown only while a job is running)
+        row += 1
+        self.progress = ttk.Progressbar(frm, mode="indeterminate")
+        self.progress.grid(column=0, row=row, columnspan=4, sticky=tk.E + tk.W, pady=(4, 0))
+        self.progress.grid_remove()
+
         # Log area
         row += 1
         ttk.Label(frm, text="輸出日誌：").grid(column=0, row=row, sticky=tk.W)
@@ -217,23 +282,35 @@ class RepackApp:
         frm.columnconfigure(3, weight=0)
         frm.rowconfigure(row, weight=1)
 
-        # Status label fonts and colors for spinner
+        # Status label fonts and colors for the busy state
         self._status_font_normal = tkfont.Font(font=self.status_lbl.cget("font"))
         self._status_font_large = self._status_font_normal.copy()
         # Increase size and bold for visibility
         self._status_font_large.configure(size=max(self._status_font_normal.cget("size") + 6, 16), weight="bold")
         fg = self.status_lbl.cget("foreground")
         self._status_fg_normal = fg if fg else "black"
+        # Label options for the busy/idle states, each applied in one configure call
+        self._status_cfg_busy = dict(font=self._status_font_large, foreground="red", anchor="center", justify="center")
+        self._status_cfg_idle = dict(font=self._status_font_normal, foreground=self._status_fg_normal, anchor="w", justify="left")
 
         # Internal state
         self._running = False
-        self._spinner_phase = 0
         self._current_action_text = "執行中"
+        # subprocess output posted by the worker thread, drained on a Tk timer
+        self._log_queue = queue.SimpleQueue()
+        self._drain_id = None
+        # text waiting for the next _flush_log
+        self._log_buf = []
+        self._log_flush_scheduled = False
 
     def _refresh_ttf_list(self):
         ttfs = find_ttfs()
+        # Nothing changed: skip rebuilding the dropdown and keep the selection
+        if ttfs == self._ttf_cache_tuple:
+            return
+        self._ttf_cache_tuple = ttfs
         if not ttfs:
-            self.ttf_menu["values"] = []
+            self.ttf_menu["values"] = ()
             self.ttf_var.set("")
             self.ttf_menu.set("(未找到 TTF)")
         else:
@@ -245,29 +322,56 @@ class RepackApp:
                 self.ttf_var.set(choice)
 
     def _append_log(self, text: str):
-        self.log.insert(tk.END, text)
+        # Buffer the text; appends within the same 50 ms collapse into one insert
+        self._log_buf.append(text)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(50, self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_scheduled = False
+        if not self._log_buf:
+            return
+        self.log.insert(tk.END, "".join(self._log_buf))
+        self._log_buf.clear()
+        # Keep only the newest lines so inserts don't slow down as the log grows
+        lines = int(self.log.index("end-1c").split(".")[0])
+        if lines > LOG_MAX_LINES:
+            self.log.delete("1.0", f"end-{LOG_MAX_LINES}l")
         self.log.see(tk.END)
 
-    def _animate_spinner(self):
-        if not self._running:
-            # Reset to normal appearance
-            self.status_lbl.config(text="就緒", font=self._status_font_normal, foreground=self._status_fg_normal, anchor="w", justify="left")
-            self.status_lbl.grid_configure(sticky=tk.W)
-            return
-        phases = [".", "..", "...", "    "]
-        base_text = self._current_action_text
-        self.status_lbl.config(
-            text=base_text + phases[self._spinner_phase % len(phases)],
-            font=self._status_font_large,
-            foreground="red",
-            anchor="center",
-            justify="center"
-        )
+    def _drain_log(self):
+        # Move everything queued since the last tick into the log buffer
+        buf = []
+        while True:
+            try:
+                buf.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if buf:
+            self._append_log("".join(buf))
+        if self._running:
+            self._drain_id = self.root.after(100, self._drain_log)
+        else:
+            self._drain_id = None
+
+    def _start_progress(self):
+        # Show the action text once; the indeterminate bar animates natively
+        self.status_var.set(self._current_action_text)
+        self.status_lbl.config(**self._status_cfg_busy)
         # Use empty sticky so the label stays centered in its grid cell (Tk expects n/e/s/w strings)
         self.status_lbl.grid_configure(sticky='')
-        self._spinner_phase += 1
-        # schedule next animation frame
-        self.root.after(400, self._animate_spinner)
+        self.progress.grid()
+        self.progress.start(80)
+        self._drain_id = self.root.after(100, self._drain_log)
+
+    def _stop_progress(self):
+        self.progress.stop()
+        self.progress.grid_remove()
+        # Reset to normal appearance
+        self.status_var.set("就緒")
+        self.status_lbl.config(**self._status_cfg_idle)
+        self.status_lbl.grid_configure(sticky=tk.W)
 
     def _on_run(self):
         if self._running:
@@ -295,7 +399,7 @@ class RepackApp:
         self._append_log(
             f"開始重打包流程：字體={ttf}, 大小={font_size}, res_pak={respak}, 語言={lang}\n"
         )
-        self._animate_spinner()
+        self._start_progress()
 
         # run in background thread
         thread = threading.Thread(
@@ -325,7 +429,7 @@ class RepackApp:
         self._append_log(
             f"開始僅提取文本：res_pak={respak}, 語言={lang}\n"
         )
-        self._animate_spinner()
+        self._start_progress()
 
         # run in background thread
         thread = threading.Thread(
@@ -359,7 +463,7 @@ class RepackApp:
         self._append_log(
             f"開始注入翻譯：xml目錄={new_xml_dir}, res_pak={respak}, 語言={lang}\n"
         )
-        self._animate_spinner()
+        self._start_progress()
 
         # run in background thread
         thread = threading.Thread(
@@ -393,7 +497,7 @@ class RepackApp:
         self._append_log(
             f"開始注入並重打包：xml目錄={new_xml_dir}, res_pak={respak}, 語言={lang}\n"
         )
-        self._animate_spinner()
+        self._start_progress()
 
         # run in background thread
         thread = threading.Thread(
@@ -404,13 +508,10 @@ class RepackApp:
         thread.start()
 
     def _run_repack_thread(self, ttf: str, font_size: int, respak: str, lang: str, mode: str):
-        # Locate Wartales_repack_font.exe (expect in the repo root or same dir as this script)
-        exe_name = "Wartales_repack_font.exe"
-        exe_path = os.path.join(os.path.dirname(__file__), exe_name)
-        if not os.path.exists(exe_path):
-            exe_path = os.path.join(os.getcwd(), exe_name)
-        if not os.path.exists(exe_path):
-            msg = f"找不到執行檔：{exe_name}。請先編譯 exe 並放置於專案根目錄。\n"
+        try:
+            exe_path = _resolve_exe()
+        except FileNotFoundError:
+            msg = f"找不到執行檔：{EXE_NAME}。請先編譯 exe 並放置於專案根目錄。\n"
             self.root.after(0, self._on_finish, False, msg)
             return
 
@@ -425,59 +526,64 @@ class RepackApp:
             respak,
             "-lang",
             lang,
+            *_MODE_ARGS.get(mode, ()),
         ]
-        if mode == "extract":
-            argv.append("--extract-only")
-        elif mode == "inject":
-            argv.append("--inject-xml")
-            argv.append("_new_xml_")
-        elif mode == "inject_and_repack":
-            argv.append("--inject-xml")
-            argv.append("_new_xml_")
-            argv.append("--continue-after-inject")
 
         # Run subprocess and capture stdout/stderr
         if IS_DEBUG:
             print(f"Running subprocess: {' '.join(argv)}")
             # just sleep 5 seconds to simulate
-            proc = subprocess.run(["sleep", "5"], capture_output=True, text=True)
-            output = proc.stdout or ""
-            exit_code = proc.returncode
+            time.sleep(5)
+            output = "[debug] simulated run\n"
+            exit_code = 0
         else:
+          output = ""
           try:
-              proc = subprocess.run(
+              # forward each line to the log as it arrives so progress is visible;
+              # lines are not batched here: a reader blocked in readline could
+              # hold a partial batch back during a long silent step, so
+              # coalescing is left to the Tk-side _drain_log tick
+              with subprocess.Popen(
                   argv,
                   stdout=subprocess.PIPE,
                   stderr=subprocess.STDOUT,
                   text=True,
+                  bufsize=1,
                   encoding="utf-8",
-                  creationflags=subprocess.CREATE_NO_WINDOW
-              )
-              output = proc.stdout or ""
-              exit_code = proc.returncode
+                  errors="replace",
+                  creationflags=SUBPROC_FLAGS
+              ) as proc:
+                  for line in proc.stdout:
+                      self._log_queue.put(line)
+                  exit_code = proc.wait()
           except Exception as exc:
-              output = f"Exception while running {exe_name}: {exc}\n"
+              output = f"Exception while running {EXE_NAME}: {exc}\n"
               exit_code = 1
 
         success = exit_code == 0
-        # Schedule GUI update with the captured output
+        # Schedule GUI update with any remaining output
         self.root.after(0, lambda: self._on_finish(success, output))
 
     def _on_finish(self, success: bool, output: str):
-        # append output to log and re-enable controls
+        # flush queued subprocess output, append the rest and re-enable controls
+        if self._drain_id is not None:
+            self.root.after_cancel(self._drain_id)
+        self._running = False
+        self._drain_log()
         self._append_log(output + "\n")
+        # show everything before the modal dialog opens
+        self._flush_log()
         if success:
             messagebox.showinfo("完成", "流程執行成功。")
         else:
             messagebox.showerror(
                 "失敗", "流程執行失敗。請查看日誌以了解詳情。"
             )
-        self._running = False
         self.run_btn.config(state=tk.NORMAL)
         self.extract_btn.config(state=tk.NORMAL)
         self.inject_btn.config(state=tk.NORMAL)
         self.mixed_btn.config(state=tk.NORMAL)
-        self.status_lbl.config(text="就緒")
+        self._stop_progress()
 
 
 def main():
@@ -487,4 +593,5 @@ def main():
 
 
 if __name__ == "__main__":
+    IS_DEBUG = parse_args().debug
     main()
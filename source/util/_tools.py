@@ -0,0 +1,71 @@
+"""External-tool settings shared by the CLI, the GUI and the util modules.
+
+`_tools_/quickbms` and `_script_` are scanned once, on first import; the
+files don't change during a run, so callers read `QUICKBMS` instead of
+probing the paths themselves.
+"""
+
+import os
+import subprocess
+from dataclasses import dataclass
+from typing import Dict, FrozenSet
+
+quickbms_folder = os.path.join("_tools_", "quickbms")
+script_folder = os.path.join("_script_")
+
+# creationflags for every external tool: no console window on Windows
+SUBPROC_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+
+
+@dataclass(frozen=True)
+class Tools:
+    bms_exe: str
+    bms_4gb_exe: str
+    script_v1: str
+    script_v2: str
+    # the paths above that were not found
+    missing: FrozenSet[str]
+
+
+def _file_names(folder: str) -> Dict[str, str]:
+    """Map lower-cased file names in `folder` to their on-disk spelling.
+
+    Empty if the folder is missing. When names differ only by case, the
+    all-lowercase spelling (the one the tools are documented with) wins.
+    """
+    names: Dict[str, str] = {}
+    try:
+        with os.scandir(folder) as it:
+            for e in it:
+                if not e.is_file():
+                    continue
+                key = e.name.lower()
+                if key not in names or e.name == key:
+                    names[key] = e.name
+    except OSError:
+        pass
+    return names
+
+
+def _discover() -> Tools:
+    bms_names = _file_names(quickbms_folder)
+    script_names = _file_names(script_folder)
+    wanted = {
+        "bms_exe": (quickbms_folder, "quickbms.exe", bms_names),
+        "bms_4gb_exe": (quickbms_folder, "quickbms_4gb_files.exe", bms_names),
+        "script_v1": (script_folder, "script-v1.bms", script_names),
+        "script_v2": (script_folder, "script-v2.bms", script_names),
+    }
+    paths = {}
+    missing = set()
+    for attr, (folder, name, names) in wanted.items():
+        # build the path from the real spelling so it also opens on
+        # case-sensitive filesystems (e.g. QuickBMS.exe)
+        on_disk = names.get(name)
+        paths[attr] = os.path.join(folder, on_disk or name)
+        if on_disk is None:
+            missing.add(paths[attr])
+    return Tools(missing=frozenset(missing), **paths)
+
+
+QUICKBMS = _discover()
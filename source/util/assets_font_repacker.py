@@ -1,9 +1,7 @@
 import os
 import subprocess
 
-
-quickbms_folder = os.path.join("_tools_", "quickbms")
-script_folder = os.path.join("_script_")
+from source.util._tools import QUICKBMS, SUBPROC_FLAGS
 
 
 def repack_assets_font() -> bool:
@@ -13,22 +11,24 @@ def repack_assets_font() -> bool:
     expected quickbms command:
     _tools_/quickbms_4gb_files.exe -w -r -r _script_/script-v2.bms ./assets.pak ./workspace/modded-assets
     """
-    bms_4gb_exe = os.path.join(quickbms_folder, "quickbms_4gb_files.exe")
-    script_bms = os.path.join(script_folder, "script-v2.bms")
+    bms_4gb_exe = QUICKBMS.bms_4gb_exe
+    script_bms = QUICKBMS.script_v2
     assets_pak = "./assets.pak"
     modded_assets_dir = "./workspace/modded-assets"
 
     # sanity checks
-    if not os.path.exists(bms_4gb_exe):
+    if bms_4gb_exe in QUICKBMS.missing:
         print(f"缺少 quickbms_4gb 執行檔: {bms_4gb_exe}")
         return False
-    if not os.path.exists(script_bms):
+    if script_bms in QUICKBMS.missing:
         print(f"缺少腳本檔案: {script_bms}")
         return False
 
     cmd = [bms_4gb_exe, "-w", "-r", "-r", script_bms, assets_pak, modded_assets_dir]
     print("執行指令:", " ".join(cmd))
-    proc = subprocess.run(cmd, capture_output=True, text=True)
+    proc = subprocess.run(
+        cmd, capture_output=True, text=True, creationflags=SUBPROC_FLAGS
+    )
     # print(proc.stdout)
     # print(proc.stderr)
 
@@ -1,10 +1,14 @@
 import os
+import re
 import shutil
 import subprocess
 from typing import List
 
-quickbms_folder = os.path.join("_tools_", "quickbms")
-script_folder = os.path.join("_script_")
+from source.util._tools import QUICKBMS, SUBPROC_FLAGS
+
+# allowed language tokens; \A/\Z so a trailing newline can't slip through
+_LANG_RE = re.compile(r"\A[A-Za-z0-9_-]+\Z")
+
 
 def _lang_to_filters(language: str) -> List[str]:
     """Generate filter patterns for a given language code."""
@@ -28,16 +32,18 @@ def extract_i18n(
     Returns a dict like {returncode, stdout, stderr, listed, extracted}.
     """
     # Validate language token (simple safety check)
-    import re
-
-    if not isinstance(language, str) or not re.match(r"^[A-Za-z0-9_-]+$", language):
+    if not isinstance(language, str) or not _LANG_RE.match(language):
         raise ValueError(f"Invalid language code: {language!r}")
 
     # Generate filters from patterns
     filters: List[str] = _lang_to_filters(language)
 
-    bms_exe = os.path.join(quickbms_folder, "quickbms.exe")
-    script_bms = os.path.join(script_folder, "script-v1.bms")
+    bms_exe = QUICKBMS.bms_exe
+    script_bms = QUICKBMS.script_v1
+    missing = [p for p in (bms_exe, script_bms) if p in QUICKBMS.missing]
+    if missing:
+        print(f"缺少 QuickBMS 檔案: {', '.join(missing)}")
+        return False
     # input_archive = os.path.join(input_archive)
     # output_dir is fixed
     output_dir = os.path.join("workspace", "extracted-res")
@@ -59,7 +65,12 @@ def extract_i18n(
     # logging the command and args
     print(f"執行 quickbms: {bms_exe} {' '.join(args)}")
 
-    result = subprocess.run([bms_exe] + args, capture_output=True, text=True)
+    result = subprocess.run(
+        [bms_exe] + args,
+        capture_output=True,
+        text=True,
+        creationflags=SUBPROC_FLAGS,
+    )
     print(result.stdout)
     print(result.stderr)
 
@@ -2,8 +2,15 @@ import os
 import shutil
 import subprocess
 
-quickbms_folder = os.path.join("_tools_", "quickbms")
-script_folder = os.path.join("_script_")
+from source.util._tools import QUICKBMS, SUBPROC_FLAGS
+
+
+def _stage(src: str, dst: str) -> None:
+    """Hardlink src to dst, copying instead when they are on different volumes."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
 
 
 def inject_i18n(res_pak: str, xml_source_dir: str, language: str = "zh") -> bool:
@@ -27,14 +34,14 @@ def inject_i18n(res_pak: str, xml_source_dir: str, language: str = "zh") -> bool
         print(f"錯誤: 未在 {xml_source_dir} 找到 XML 來源目錄")
         return False
 
-    bms_exe = os.path.join(quickbms_folder, "quickbms.exe")
-    script_bms = os.path.join(script_folder, "script-v1.bms")
+    bms_exe = QUICKBMS.bms_exe
+    script_bms = QUICKBMS.script_v1
 
-    if not os.path.exists(bms_exe):
+    if bms_exe in QUICKBMS.missing:
         print(f"錯誤: 未在 {bms_exe} 找到 QuickBMS 執行檔")
         return False
 
-    if not os.path.exists(script_bms):
+    if script_bms in QUICKBMS.missing:
         print(f"錯誤: 未在 {script_bms} 找到 BMS 腳本")
         return False
 
@@ -42,10 +49,16 @@ def inject_i18n(res_pak: str, xml_source_dir: str, language: str = "zh") -> bool
     staging_dir = os.path.join("workspace", "inject-res")
     staging_lang_dir = os.path.join(staging_dir, "lang")
 
-    # Clean staging area
-    if os.path.exists(staging_dir):
-        shutil.rmtree(staging_dir)
+    # Clean staging area, keeping the directories themselves
     os.makedirs(staging_lang_dir, exist_ok=True)
+    for folder in (staging_dir, staging_lang_dir):
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.path != staging_lang_dir:
+                        shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
 
     # 3. Copy files to staging area with correct structure
     files_to_inject = [f"texts_{language}.xml", f"export_{language}.xml"]
@@ -55,7 +68,7 @@ def inject_i18n(res_pak: str, xml_source_dir: str, language: str = "zh") -> bool
         src_path = os.path.join(xml_source_dir, fname)
         if os.path.exists(src_path):
             dst_path = os.path.join(staging_lang_dir, fname)
-            shutil.copy2(src_path, dst_path)
+            _stage(src_path, dst_path)
             print(f"已暫存以供注入: {fname}")
             found_any = True
         else:
@@ -71,7 +84,9 @@ def inject_i18n(res_pak: str, xml_source_dir: str, language: str = "zh") -> bool
 
     print(f"執行重新導入: {' '.join(cmd)}")
     try:
-        proc = subprocess.run(cmd, capture_output=True, text=True)
+        proc = subprocess.run(
+            cmd, capture_output=True, text=True, creationflags=SUBPROC_FLAGS
+        )
         # print(proc.stdout) # Verbose output might be too much, but useful for debug
         if proc.returncode != 0:
             print("QuickBMS 重新導入失敗。")
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+import zipfile
+import zlib
+from pathlib import Path
+
+from zip_build_bundle import DEFLATE_LEVEL, zip_dir
+
+
+def _raw_deflate_size(data: bytes, level: int) -> int:
+    c = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return len(c.compress(data) + c.flush())
+
+
+class TestZipDir(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.dist = self.tmp / "dist"
+        os.makedirs(self.dist / "lang")
+        # compressible text where level 1 and level 6 give different sizes
+        self.xml = "".join(
+            f'<text id="{i}">{i * 7919 % 10007} 中文字體 {i % 97}</text>\n'
+            for i in range(20000)
+        ).encode("utf-8")
+        (self.dist / "lang" / "texts_zh.xml").write_bytes(self.xml)
+        (self.dist / "font.TTF").write_bytes(b"\0" * 4096)
+        self.zip_file = self.tmp / "build" / "bundle.zip"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_deflated_entry_uses_configured_level(self):
+        zip_dir(self.dist, self.zip_file)
+        with zipfile.ZipFile(self.zip_file) as zf:
+            info = zf.getinfo("lang/texts_zh.xml")
+            self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(
+                info.compress_size, _raw_deflate_size(self.xml, DEFLATE_LEVEL)
+            )
+            self.assertNotEqual(
+                info.compress_size,
+                _raw_deflate_size(self.xml, 6),
+                msg="entry was compressed at zlib's default level",
+            )
+            self.assertEqual(zf.read("lang/texts_zh.xml"), self.xml)
+
+    def test_compressed_formats_are_stored(self):
+        zip_dir(self.dist, self.zip_file)
+        with zipfile.ZipFile(self.zip_file) as zf:
+            info = zf.getinfo("font.TTF")
+            self.assertEqual(info.compress_type, zipfile.ZIP_STORED)
+            self.assertIsNone(zf.testzip())
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks not supported")
+    def test_symlink_to_directory_is_skipped(self):
+        try:
+            os.symlink(self.dist / "lang", self.dist / "link", target_is_directory=True)
+        except OSError:
+            self.skipTest("cannot create symlinks here")
+        zip_dir(self.dist, self.zip_file, sort=True)
+        with zipfile.ZipFile(self.zip_file) as zf:
+            self.assertEqual(zf.namelist(), ["font.TTF", "lang/texts_zh.xml"])
+
+
+if __name__ == "__main__":
+    unittest.main()
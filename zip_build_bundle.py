@@ -11,41 +11,114 @@ Behavior:
 
 Usage:
   python zip_build_bundle.py [--dist DIST] [--build BUILD] [--zip-name ZIPNAME]
-                            [--timestamp] [--dry-run] [--verbose]
+                            [--timestamp] [--sorted] [--dry-run] [--verbose]
 """
 
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 import zipfile
 import shutil
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 DEFAULT_ZIP_NAME = "Wartales 戰爭傳說 重注中文字體包.zip"
 FALLBACK_ZIP_NAME = "Wartales_repack_zh.zip"
+_TS_FMT = "%Y%m%d-%H%M%S"
 
+# read size when streaming files into the zip
+COPY_BUFSIZE = 1 << 20
 
-def zip_dir(dist: Path, zip_file: Path, verbose: bool = False) -> None:
+# deflate level for compressible entries; level 1 is several times faster
+# than zlib's default 6 for a small size cost
+DEFLATE_LEVEL = 1
+
+# already-compressed formats; deflating them again costs CPU for ~1:1 output
+STORED_EXTS = frozenset(
+    {".pak", ".png", ".jpg", ".jpeg", ".zip", ".ttf", ".otf", ".woff", ".woff2"}
+)
+
+
+def _set_compress_level(zi: zipfile.ZipInfo, level: int) -> None:
+    """Set the deflate level for one entry (public attribute on 3.13+)."""
+    if hasattr(zi, "compress_level"):
+        zi.compress_level = level
+    else:
+        zi._compresslevel = level
+
+
+def _iter_files(root: str) -> Iterator[str]:
+    """Yield the paths of all files under ``root``.
+
+    Directories, including symlinks to directories, are not yielded.
+
+    Uses an iterative ``os.scandir`` walk so entry types come from the
+    directory listing itself instead of a stat per path.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.is_file():
+                    # regular files and links to files; skips links to dirs
+                    yield e.path
+
+
+def zip_dir(
+    dist: Path, zip_file: Path, verbose: bool = False, sort: bool = False
+) -> None:
     """Create a zip at ``zip_file`` containing everything under ``dist``.
 
     Files keep their path relative to ``dist`` (no leading directory).
+    Entries are written as the walk finds them; pass ``sort=True`` to
+    collect and sort the paths first for a reproducible entry order.
+
+    Entries are compressed one after another: ``zipfile`` has no public way
+    to write pre-deflated data, and with ``.pak``/``.ttf``/``.png`` stored
+    the remaining deflate work at level 1 is too small to pay for worker
+    processes.
     """
     if not dist.exists():
         raise FileNotFoundError(f"Dist directory not found: {dist}")
     # Ensure parent directory exists
     zip_file.parent.mkdir(parents=True, exist_ok=True)
 
+    # one buffer reused for every entry instead of a new bytes object per read
+    buf = bytearray(COPY_BUFSIZE)
+    view = memoryview(buf)
     compression = zipfile.ZIP_DEFLATED
-    with zipfile.ZipFile(zip_file, mode="w", compression=compression) as zf:
-        for p in sorted(dist.rglob("*")):
-            if p.is_dir():
-                continue
-            arcname = p.relative_to(dist).as_posix()
+    # strict_timestamps=False clamps pre-1980 mtimes instead of raising
+    with zipfile.ZipFile(
+        zip_file,
+        mode="w",
+        compression=compression,
+        strict_timestamps=False,
+    ) as zf:
+        files = _iter_files(str(dist))
+        if sort:
+            files = sorted(files)
+        for p in files:
+            arcname = os.path.relpath(p, dist).replace(os.sep, "/")
             if verbose:
                 print(f"Adding: {p} -> {arcname}")
-            zf.write(p, arcname)
+            # stream through a fixed-size buffer so memory stays bounded
+            zi = zipfile.ZipInfo.from_file(p, arcname, strict_timestamps=False)
+            ext = os.path.splitext(p)[1].lower()
+            if ext in STORED_EXTS:
+                zi.compress_type = zipfile.ZIP_STORED
+            else:
+                zi.compress_type = compression
+                # ZipFile's compresslevel only applies to entries opened by
+                # name, so the level has to go on the ZipInfo itself
+                _set_compress_level(zi, DEFLATE_LEVEL)
+            with zf.open(zi, "w", force_zip64=True) as dst, open(p, "rb", buffering=0) as src:
+                while n := src.readinto(buf):
+                    dst.write(view[:n])
 
 
 def parse_args(argv: Optional[list[str]] = None):
@@ -61,6 +134,12 @@ def parse_args(argv: Optional[list[str]] = None):
         action="store_true",
         help="don't actually write the zip, just print what would happen",
     )
+    p.add_argument(
+        "--sorted",
+        dest="sort",
+        action="store_true",
+        help="write entries in sorted path order (reproducible builds)",
+    )
     p.add_argument("--verbose", "-v", action="store_true", help="verbose output")
     return p.parse_args(argv)
 
@@ -68,11 +147,8 @@ def parse_args(argv: Optional[list[str]] = None):
 def make_zip_name(base_name: str, timestamp: bool) -> str:
     if not timestamp:
         return base_name
-    from datetime import datetime
-
-    ts = datetime.now().strftime("%Y%m%d-%H%M%S")
-    stem, ext = (base_name, "") if "." not in base_name else base_name.rsplit(".", 1)
-    return f"{stem}-{ts}.{ext}" if ext else f"{stem}-{ts}"
+    stem, ext = os.path.splitext(base_name)
+    return f"{stem}-{datetime.now().strftime(_TS_FMT)}{ext}"
 
 
 def main(argv: Optional[list[str]] = None) -> int:
@@ -116,7 +192,7 @@ def main(argv: Optional[list[str]] = None) -> int:
         return 0
 
     try:
-        zip_dir(dist, zip_path, verbose=args.verbose)
+        zip_dir(dist, zip_path, verbose=args.verbose, sort=args.sort)
     except FileNotFoundError as e:
         print(e)
         return 1
@@ -129,7 +205,7 @@ def main(argv: Optional[list[str]] = None) -> int:
                 f"Failed to write unicode zip name ({first_exc}). Trying fallback: {fallback}"
             )
             try:
-                zip_dir(dist, fallback_path, verbose=args.verbose)
+                zip_dir(dist, fallback_path, verbose=args.verbose, sort=args.sort)
                 print(f"Packaged build into: {fallback_path}")
                 return 0
             except Exception as second_exc:  # pylint: disable=broad-except